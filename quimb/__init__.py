@@ -55,6 +55,7 @@ from .core import (
     sparse,
     infer_size,
     trace,
+    tracemm,
     identity,
     eye,
     speye,
@@ -301,6 +302,7 @@ __all__ = [
     "sparse",
     "infer_size",
     "trace",
+    "tracemm",
     "identity",
     "eye",
     "speye",
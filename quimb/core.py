@@ -10,7 +10,7 @@ from numbers import Integral
 import numpy as np
 import scipy.sparse as sp
 
-from .utils import partition_all
+from .utils import find_library, partition_all
 
 try:
     from math import prod
@@ -449,10 +449,19 @@ def isherm(qob, **allclose_opts):
     -------
     bool
     """
+    m, n = qob.shape
+    if m != n:
+        return False
+
     if issparse(qob):
-        return allclose_sparse(qob, dag(qob), **allclose_opts)
-    else:
-        return np.allclose(qob, dag(qob), **allclose_opts)
+        # single O(nnz) subtraction rather than comparing the full pattern
+        # and values of two separate matrices
+        diff = qob - dag(qob)
+        if diff.nnz == 0:
+            return True
+        return np.allclose(diff.data, 0.0, **allclose_opts)
+
+    return np.allclose(qob, dag(qob), **allclose_opts)
 
 
 def ispos(qob, tol=1e-15):
@@ -667,6 +676,32 @@ def rdot(a, b):  # pragma: no cover
     return (a @ b).item()
 
 
+@realify
+def tracemm(a, b):
+    """Trace of the product of two operators, without forming the product,
+    using the identity ``tr(a @ b) == (a * b.T).sum()``. This replaces an
+    O(d^3) matrix multiplication with an O(d^2) elementwise one.
+
+    Parameters
+    ----------
+    a : dense or sparse operator
+        First operator.
+    b : dense or sparse operator
+        Second operator.
+
+    Returns
+    -------
+    x : float
+        Trace of ``a @ b``.
+    """
+    if issparse(a):
+        return a.multiply(b.T).sum()
+    if issparse(b):
+        # tr(a @ b) == tr(b @ a)
+        return b.multiply(a.T).sum()
+    return np.multiply(np.asarray(a), np.asarray(b).T).sum()
+
+
 @pnjit
 def _l_diag_dot_dense_par(l, A, out):  # pragma: no cover
     for i in numba.prange(l.size):
@@ -797,12 +832,25 @@ def explt(l, t):  # pragma: no cover
 
 
 @njit
-def _nb_kron_exp_seq(a, b, out, m, n, p, q):  # pragma: no cover
+def _nb_kron_2x2(a, b, out):  # pragma: no cover
+    a00, a01, a10, a11 = a[0, 0], a[0, 1], a[1, 0], a[1, 1]
+    for i in range(2):
+        for j in range(2):
+            bij = b[i, j]
+            out[i, j] = a00 * bij
+            out[i, 2 + j] = a01 * bij
+            out[2 + i, j] = a10 * bij
+            out[2 + i, 2 + j] = a11 * bij
+
+
+@njit
+def _nb_kron_small(a, b, out, m, n, p, q):  # pragma: no cover
     for i in range(m):
         for j in range(n):
-            ii, fi = i * p, (i + 1) * p
-            ij, fj = j * q, (j + 1) * q
-            out[ii:fi, ij:fj] = a[i, j] * b
+            aij = a[i, j]
+            for k in range(p):
+                for l in range(q):
+                    out[i * p + k, j * q + l] = aij * b[k, l]
 
 
 @pnjit
@@ -815,16 +863,56 @@ def _nb_kron_exp_par(a, b, out, m, n, p, q):  # pragma: no cover
 
 
 @ensure_qarray
-def kron_dense(a, b, par_thresh=4096):
+def kron_dense(a, b, out=None, par_thresh=4096):
+    """Dense tensor (kronecker) product of ``a`` and ``b``.
+
+    Parameters
+    ----------
+    a, b : dense 2d arrays
+        Operators to tensor together.
+    out : dense 2d array, optional
+        If given, an existing array of shape
+        ``(a.shape[0] * b.shape[0], a.shape[1] * b.shape[1])`` and suitable
+        dtype to write the result into, avoiding the output allocation -
+        useful when tensoring in a tight loop.
+    par_thresh : int, optional
+        Output size above which to use the parallel kernel.
+    """
     m, n = a.shape
     p, q = b.shape
 
-    out = np.empty((m * p, n * q), dtype=common_type(a, b))
+    if out is None:
+        out = np.empty((m * p, n * q), dtype=common_type(a, b))
+    elif out.shape != (m * p, n * q):
+        # the compiled kernels write unchecked - never hand them a wrong
+        # sized buffer
+        raise ValueError(
+            f"`out` has shape {out.shape} but the tensor "
+            f"product requires shape {(m * p, n * q)}."
+        )
 
-    if out.size > 4096:
+    if m == n == p == q == 2:
+        # fully unrolled qubit-qubit case - by far the most common
+        _nb_kron_2x2(a, b, out)
+    elif out.size <= 256:
+        # small operators: compiled loops beat numpy's dispatch overhead
+        _nb_kron_small(a, b, out, m, n, p, q)
+    elif out.size > par_thresh:
         _nb_kron_exp_par(a, b, out, m, n, p, q)
+    elif out.flags.c_contiguous:
+        # fused outer product written directly into the output - a single
+        # C-level pass rather than explicit python-level block assignment
+        # (benchmarked faster than a BLAS rank-1 gemm of vec(a) x vec(b),
+        # which needs an extra transpose copy to get the kron layout)
+        np.multiply(
+            np.asarray(a).reshape(m, 1, n, 1),
+            np.asarray(b).reshape(1, p, 1, q),
+            out=out.reshape(m, p, n, q),
+        )
     else:
-        _nb_kron_exp_seq(a, b, out, m, n, p, q)
+        # reshaping a non-contiguous ``out`` to 4d would silently write into
+        # a copy - the compiled loops handle any strides
+        _nb_kron_small(a, b, out, m, n, p, q)
 
     return out
 
@@ -838,7 +926,9 @@ def kron_sparse(a, b, stype=None):
         stype = (
             "bsr"
             if isinstance(b, np.ndarray) or b.format == "bsr"
-            else b.format
+            # don't propagate 'dia' (used for cheap identity construction) as
+            # an output format - downstream expects compressed formats
+            else ("csr" if b.format == "dia" else b.format)
             if isinstance(a, np.ndarray)
             else "csc"
             if a.format == "csc" and b.format == "csc"
@@ -893,11 +983,11 @@ _EXPEC_METHODS = {
     (0, 0, 0): lambda a, b: abs(vdot(a, b)) ** 2,
     (0, 1, 0): lambda a, b: vdot(a, b @ a),
     (1, 0, 0): lambda a, b: vdot(b, a @ b),
-    (1, 1, 0): lambda a, b: _trace_dense(a @ b),
+    (1, 1, 0): lambda a, b: tracemm(a, b),
     (0, 0, 1): lambda a, b: abs(dot(dag(a), b)[0, 0]) ** 2,
     (0, 1, 1): realify(lambda a, b: dot(dag(a), dot(b, a))[0, 0]),
     (1, 0, 1): realify(lambda a, b: dot(dag(b), dot(a, b))[0, 0]),
-    (1, 1, 1): lambda a, b: _trace_sparse(dot(a, b)),
+    (1, 1, 1): lambda a, b: tracemm(a, b),
 }
 
 
@@ -955,8 +1045,13 @@ def normalize(qob, inplace=True):
 
     if isop(qob):
         n_factor = trace(qob)
+    elif issparse(qob):
+        # tr(|q><q| @ |q><q|)^0.25 == (sum_i |q_i|^2)^0.5 - compute from the
+        # stored values only rather than forming <q| and multiplying
+        n_factor = qob.multiply(qob.conj()).sum().real**0.5
     else:
-        n_factor = expectation(qob, qob) ** 0.25
+        # tr(|q><q| @ |q><q|)^0.25 == <q|q>^0.5 - a single linear pass
+        n_factor = vdot(qob, qob) ** 0.5
 
     qob[:] /= n_factor
     return qob
@@ -982,14 +1077,36 @@ def chop(qob, tol=1.0e-15, inplace=True):
     dense or sparse vector or operator
         Chopped quantum object.
     """
-    minm = np.abs(qob).max() * tol  # minimum value tolerated
-    if not inplace:
-        qob = qob.copy()
     if issparse(qob):
-        qob.data.real[np.abs(qob.data.real) < minm] = 0.0
-        qob.data.imag[np.abs(qob.data.imag) < minm] = 0.0
+        # work on the stored values only - O(nnz) not O(d^2)
+        data = qob.data
+        if data.size == 0:
+            # no stored entries - nothing to chop
+            return qob if inplace else qob.copy()
+        minm = np.abs(data).max() * tol  # minimum value tolerated
+        small_re = np.abs(data.real) < minm
+        if np.iscomplexobj(data):
+            small_im = np.abs(data.imag) < minm
+            any_small = small_re.any() or small_im.any()
+        else:
+            small_im = None
+            any_small = small_re.any()
+
+        if not any_small:
+            # nothing to chop - skip the structural rebuild entirely
+            return qob if inplace else qob.copy()
+
+        if not inplace:
+            qob = qob.copy()
+            data = qob.data
+        data.real[small_re] = 0.0
+        if small_im is not None:
+            data.imag[small_im] = 0.0
         qob.eliminate_zeros()
     else:
+        minm = np.abs(qob).max() * tol  # minimum value tolerated
+        if not inplace:
+            qob = qob.copy()
         qob.real[np.abs(qob.real) < minm] = 0.0
         qob.imag[np.abs(qob.imag) < minm] = 0.0
     return qob
@@ -1066,6 +1183,10 @@ def quimbify(
         with 1 stored elements in Compressed Sparse Row format>
     """
 
+    # keep a reference to the raw input so we can detect below whether the
+    # output would write through to the caller's memory
+    input_data = data
+
     sparse_input = issparse(data)
     sparse_output = (
         (sparse)
@@ -1088,8 +1209,17 @@ def quimbify(
         elif qtype in ("b", "bra"):
             data = data.reshape((1, prod(data.shape))).conj()
         elif qtype in ("d", "r", "rho", "op", "dop") and isvec(data):
-            data = dot(quimbify(data, "ket"), quimbify(data, "bra"))
-        data = data.astype(dtype)
+            # single outer product, skipping the intermediate ket and bra
+            vec = np.ravel(data)
+            if normalized:
+                # since tr(|v><v|) == <v|v>, normalizing the vector first -
+                # O(d) - yields a normalized operator directly, skipping the
+                # O(d^2) rescale pass over the full output
+                vec = vec * (vdot(vec, vec) ** -0.5)
+                normalized = False
+            data = outer(vec, vec.conj())
+        # a no-op (view) if the dtype already matches
+        data = data.astype(dtype, copy=False)
 
     # Just cast as qarray
     elif not sparse_output:
@@ -1102,10 +1232,18 @@ def quimbify(
         )
 
     # Optionally normalize and chop small components
-    if normalized:
-        normalize_(data)
-    if chopped:
-        chop_(data)
+    if normalized or chopped:
+        # these mutate - only now take a copy if output still aliases input
+        if (
+            isdense(data)
+            and isdense(input_data)
+            and np.shares_memory(data, input_data)
+        ):
+            data = data.copy()
+        if normalized:
+            normalize_(data)
+        if chopped:
+            chop_(data)
 
     return data
 
@@ -1204,6 +1342,19 @@ def _identity_sparse(d, stype="csr", dtype=complex):
     return sp.eye(d, dtype=dtype, format=stype)
 
 
+@functools.lru_cache(maxsize=64)
+def _identity_cached(d, sparse, stype, dtype):
+    """Cached construction of small identities, which are built over and over
+    in e.g. operator generation - made immutable since they are shared.
+    """
+    if sparse:
+        ID = _identity_sparse(d, stype=stype, dtype=dtype)
+    else:
+        ID = _identity_dense(d, dtype=dtype)
+    make_immutable(ID)
+    return ID
+
+
 def identity(d, sparse=False, stype="csr", dtype=complex):
     """Return identity of size d in complex format, optionally sparse.
 
@@ -1219,8 +1370,16 @@ def identity(d, sparse=False, stype="csr", dtype=complex):
     Returns
     -------
     id : qarray or sparse matrix
-        Identity operator.
+        Identity operator. Note that for small ``d`` this is cached and thus
+        read-only - take a copy if you need to modify it in place.
     """
+    if d <= 64:
+        try:
+            return _identity_cached(d, sparse, stype, dtype)
+        except TypeError:
+            # unhashable dtype specifier
+            pass
+
     if sparse:
         return _identity_sparse(d, stype=stype, dtype=dtype)
 
@@ -1234,10 +1393,31 @@ speye = functools.partial(identity, sparse=True)
 """Sparse identity."""
 
 
+def _combine_dense_runs(ops):
+    """Tensor together consecutive runs of dense operators with the dense
+    kernel, so a mixed dense/sparse chain enters the sparse reduction with as
+    few factors as possible and dense blocks aren't expanded through sparse
+    kron one at a time.
+    """
+    run = []
+    for op in ops:
+        if issparse(op):
+            if run:
+                yield functools.reduce(kron_dense, run)
+                run = []
+            yield op
+        else:
+            run.append(op)
+    if run:
+        yield functools.reduce(kron_dense, run)
+
+
 def _kron_core(*ops, stype=None, coo_build=False, parallel=False):
     """Core kronecker product for a sequence of objects."""
     tmp_stype = "coo" if coo_build or stype == "coo" else None
     reducer = par_reduce if parallel else functools.reduce
+    if not parallel and any(issparse(op) for op in ops):
+        ops = tuple(_combine_dense_runs(ops))
     return reducer(functools.partial(kron_dispatch, stype=tmp_stype), ops)
 
 
@@ -1406,8 +1586,28 @@ def kronpow(a, p, **kron_opts):
     Returns
     -------
     dense or sparse vector or operator
+
+    Notes
+    -----
+    This uses a repeated squaring strategy, i.e. builds
+    ``a & a -> a2 & a2 -> ...``, so that only ``O(log2(p))`` pairwise tensor
+    products are needed, rather than a linear chain of ``p - 1``.
     """
-    ops = (a,) * p
+    coo_build = kron_opts.get("coo_build", False)
+    stype = kron_opts.get("stype", None)
+    tmp_stype = "coo" if coo_build or stype == "coo" else None
+
+    # binary decomposition of the power: collect a, a**2, a**4, ... for each
+    # set bit, then combine - ordering is irrelevant as all factors commute
+    ops = []
+    base = a
+    while p:
+        if p & 1:
+            ops.append(base)
+        p >>= 1
+        if p:
+            base = kron_dispatch(base, base, stype=tmp_stype)
+
     return kron(*ops, **kron_opts)
 
 
@@ -1645,6 +1845,63 @@ def dim_compress(dims, inds):
     return dims, inds
 
 
+def _ikron_dense_place(factors, dtype):
+    """Dense fast path for :func:`ikron`.
+
+    Takes a sequence of ``factors`` -- 2D operators interspersed with
+    identity blocks given as plain integer sizes -- and writes their tensor
+    product directly into a zeroed output array. The identity blocks are
+    never materialized: they simply constrain which (block-diagonal) strided
+    positions of the output the tensor product of the actual operators is
+    broadcast into. This skips all the zero-structure flops and intermediate
+    allocations of an explicit kronecker chain.
+    """
+    # row and column dimension of every factor, in order
+    rdims = tuple(f if isinstance(f, Integral) else f.shape[0] for f in factors)
+    cdims = tuple(f if isinstance(f, Integral) else f.shape[1] for f in factors)
+    D1, D2 = prod(rdims), prod(cdims)
+
+    ops = [f for f in factors if not isinstance(f, Integral)]
+    if not ops:
+        return _identity_dense(D1, dtype=dtype)
+
+    # flat row/col strides of each factor within the full output
+    rstrides = [prod(rdims[i + 1 :]) for i in range(len(factors))]
+    cstrides = [prod(cdims[i + 1 :]) for i in range(len(factors))]
+
+    out = np.zeros((D1, D2), dtype=dtype)
+
+    # build a strided view of ``out`` with one axis per identity block
+    # (diagonal -> row and column advance together) and a row plus column
+    # axis per operator
+    id_shape, id_strides = [], []
+    op_rshape, op_rstrides = [], []
+    op_cshape, op_cstrides = [], []
+    for f, rs, cs in zip(factors, rstrides, cstrides):
+        if isinstance(f, Integral):
+            id_shape.append(f)
+            id_strides.append(rs * D2 + cs)
+        else:
+            op_rshape.append(f.shape[0])
+            op_rstrides.append(rs * D2)
+            op_cshape.append(f.shape[1])
+            op_cstrides.append(cs)
+
+    v = np.lib.stride_tricks.as_strided(
+        out,
+        shape=(*id_shape, *op_rshape, *op_cshape),
+        strides=tuple(
+            s * out.itemsize
+            for s in (*id_strides, *op_rstrides, *op_cstrides)
+        ),
+    )
+
+    G = functools.reduce(kron_dense, ops)
+    v[...] = np.asarray(G).reshape(*op_rshape, *op_cshape)
+
+    return qarray(out)
+
+
 def ikron(
     ops,
     dims,
@@ -1752,14 +2009,18 @@ def ikron(
     inds, ops = zip(*sorted(zip(inds, itertools.cycle(ops))))
     inds, ops = set(inds), iter(ops)
 
-    # can't slice "coo" format so use "csr" if ownership specified
+    # identity pads are cheapest to build diagonally - O(d) with a single
+    # data array - but can't slice "dia" so use "csr" if ownership specified
     eye_kws = {
         "sparse": sparse,
-        "stype": "csr" if ownership else "coo",
+        "stype": "csr" if ownership else "dia",
         "dtype": dtype,
     }
 
-    def gen_ops():
+    def gen_factors():
+        """Yield the operators in order, with identity blocks compressed and
+        represented by their integer size only.
+        """
         cff_id = 1  # keeps track of compressing adjacent identities
         cff_ov = 1  # keeps track of overlaying op on multiple dimensions
         for ind, dim in enumerate(dims):
@@ -1767,7 +2028,7 @@ def ikron(
             if ind in inds:
                 # check if need preceding identities
                 if cff_id > 1:
-                    yield eye(cff_id, **eye_kws)
+                    yield cff_id
                     cff_id = 1  # reset cumulative identity size
 
                 # check if first subsystem in placement block
@@ -1793,7 +2054,18 @@ def ikron(
 
         # check if trailing identity needed
         if cff_id > 1:
-            yield eye(cff_id, **eye_kws)
+            yield cff_id
+
+    if not (sparse or parallel or coo_build or stype or ownership):
+        # dense fast path - scatter ops straight into the padded output
+        return _ikron_dense_place(tuple(gen_factors()), dtype)
+
+    def gen_ops():
+        for factor in gen_factors():
+            if isinstance(factor, Integral):
+                yield eye(factor, **eye_kws)
+            else:
+                yield factor
 
     return kron(
         *gen_ops(),
@@ -2016,27 +2288,88 @@ def itrace(a, axes=(0, 1)):
     return a
 
 
+_FOUND_OPT_EINSUM = find_library("opt_einsum")
+
+
+@functools.lru_cache(maxsize=128)
+def _ptr_contract_expression(dims, keep):
+    """Build (and cache) an ``opt_einsum`` contraction expression performing
+    the dense partial trace for subsystems ``dims``, keeping ``keep``. For
+    many subsystems the contraction order matters and finding it is itself
+    costly, so expressions are cached on ``(dims, keep)`` and reused.
+    """
+    import opt_einsum as oe
+
+    n = len(dims)
+    lose = ind_complement(keep, n)
+    ket = [oe.get_symbol(i) for i in range(n)]
+    bra = [oe.get_symbol(i if i in lose else i + n) for i in range(n)]
+    out = [oe.get_symbol(i + d) for d in (0, n) for i in keep]
+    eq = "".join((*ket, *bra, "->", *out))
+    return oe.contract_expression(eq, (*dims, *dims), optimize="auto-hq")
+
+
 @ensure_qarray
 def _partial_trace_dense(p, dims, keep):
     """Perform partial trace of a dense matrix."""
     if isinstance(keep, Integral):
         keep = (keep,)
+    else:
+        # might be e.g. a 0d or 1d array
+        keep = tuple(np.atleast_1d(keep))
     if isvec(p):  # p = psi
         p = np.asarray(p).reshape(dims)
         lose = ind_complement(keep, len(dims))
         p = np.tensordot(p, p.conj(), (lose, lose))
         d = int(p.size**0.5)
         return p.reshape((d, d))
+
+    n = len(dims)
+    lose = ind_complement(keep, n)
+    keep = sorted(keep)
+
+    if _FOUND_OPT_EINSUM and n >= 4:
+        # contraction order starts to matter - use a cached optimized path
+        expr = _ptr_contract_expression(
+            tuple(map(int, dims)), tuple(map(int, keep))
+        )
+        p = expr(np.asarray(p).reshape((*dims, *dims)))
     else:
-        p = np.asarray(p).reshape((*dims, *dims))
-        total_dims = len(dims)
-        lose = ind_complement(keep, total_dims)
-        lose2 = tuple(ind + total_dims for ind in lose)
-        p = itrace(p, (lose, lose2))
+        # single einsum traces all lost subsystems at once: those axes share
+        # a label between the ket and bra side, kept bra axes are offset by
+        # ``n``
+        ket_labels = list(range(n))
+        bra_labels = [i if i in lose else i + n for i in range(n)]
+        out_labels = [*keep, *(i + n for i in keep)]
+        p = np.einsum(
+            np.asarray(p).reshape((*dims, *dims)),
+            ket_labels + bra_labels,
+            out_labels,
+            optimize=True,
+        )
     d = int(p.size**0.5)
     return p.reshape((d, d))
 
 
+@njit
+def _nb_trace_lose_csr(data, indices, indptr, eb, b, out):  # pragma: no cover
+    # each row decomposes as ``r = x * (e * b) + m * b + t`` with ``m`` the
+    # traced subsystem coordinate - a stored entry contributes iff the traced
+    # coordinates of its row and column match
+    for r in range(indptr.size - 1):
+        x1 = r // eb
+        rem = r - x1 * eb
+        m1 = rem // b
+        i = x1 * b + (rem - m1 * b)
+        for jj in range(indptr[r], indptr[r + 1]):
+            c = indices[jj]
+            x2 = c // eb
+            rem = c - x2 * eb
+            m2 = rem // b
+            if m1 == m2:
+                out[i, x2 * b + (rem - m2 * b)] += data[jj]
+
+
 def _trace_lose(p, dims, lose):
     """Simple partial trace where the single subsytem at ``lose``
     is traced out.
@@ -2047,6 +2380,11 @@ def _trace_lose(p, dims, lose):
     a = prod(dims[:lose])
     b = prod(dims[lose + 1 :])
     rhos = np.zeros(shape=(a * b, a * b), dtype=np.complex128)
+    if issparse(p):
+        # single O(nnz) scatter over the stored entries
+        p = p.tocsr()
+        _nb_trace_lose_csr(p.data, p.indices, p.indptr, e * b, b, rhos)
+        return rhos
     for i in range(a * b):
         for j in range(i, a * b):
             i_i = e * b * (i // b) + (i % b)
@@ -2059,6 +2397,25 @@ def _trace_lose(p, dims, lose):
     return rhos
 
 
+@njit
+def _nb_trace_keep_csr(data, indices, indptr, sb, b, out):  # pragma: no cover
+    # each row decomposes as ``r = k * (s * b) + i * b + t`` with ``i`` the
+    # kept subsystem coordinate - a stored entry contributes iff both traced
+    # coordinates of its row and column match
+    for r in range(indptr.size - 1):
+        k1 = r // sb
+        rem = r - k1 * sb
+        i = rem // b
+        t1 = rem - i * b
+        for jj in range(indptr[r], indptr[r + 1]):
+            c = indices[jj]
+            k2 = c // sb
+            rem = c - k2 * sb
+            j = rem // b
+            if (k1 == k2) and (t1 == rem - j * b):
+                out[i, j] += data[jj]
+
+
 def _trace_keep(p, dims, keep):
     """Simple partial trace where the single subsytem
     at ``keep`` is kept.
@@ -2069,6 +2426,11 @@ def _trace_keep(p, dims, keep):
     a = prod(dims[:keep])
     b = prod(dims[keep + 1 :])
     rhos = np.zeros(shape=(s, s), dtype=np.complex128)
+    if issparse(p):
+        # single O(nnz) scatter over the stored entries
+        p = p.tocsr()
+        _nb_trace_keep_csr(p.data, p.indices, p.indptr, s * b, b, rhos)
+        return rhos
     for i in range(s):
         for j in range(i, s):
             for k in range(a):
@@ -181,7 +181,7 @@ def bloch_state(ax, ay, az, purified=False, **kwargs):
                for a, s in zip((1, ax, ay, az), "ixyz"))
 
 
-@functools.lru_cache(maxsize=8)
+@functools.lru_cache(maxsize=16)
 def bell_state(s, **kwargs):
     r"""One of the four bell-states.
 
@@ -404,6 +404,27 @@ class TestKron:
         assert_allclose(x, xn)
         assert isinstance(x, qarray)
 
+    def test_kron_dense_out(self, mat_d, mat_d2):
+        out = np.empty((_TEST_SZ**2, _TEST_SZ**2), dtype=complex)
+        x = kron_dense(mat_d, mat_d2, out=out)
+        assert_allclose(x, np.kron(mat_d, mat_d2))
+        assert np.shares_memory(x, out)
+
+    def test_kron_dense_out_wrong_shape(self, mat_d, mat_d2):
+        out = np.empty((_TEST_SZ, _TEST_SZ), dtype=complex)
+        with raises(ValueError):
+            kron_dense(mat_d, mat_d2, out=out)
+
+    def test_kron_dense_out_non_contiguous(self):
+        # big enough to hit the fused broadcast path, which needs to fall
+        # back to the strided kernel for a non-contiguous buffer
+        a, b = rand_matrix(5), rand_matrix(5)
+        big = np.empty((25, 50), dtype=complex)
+        out = big[:, ::2]
+        x = kron_dense(a, b, out=out)
+        assert_allclose(x, np.kron(a, b))
+        assert np.shares_memory(x, big)
+
     def test_kron_multi_args(self, mat_d, mat_d2, mat_d3):
         assert_allclose(kron(mat_d), mat_d)
         assert_allclose(
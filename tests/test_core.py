@@ -195,6 +195,17 @@ class TestTrace:
         assert qu.trace(a) == outpt
 
 
+class TestTracemm:
+    @mark.parametrize("sparse_a", [False, True])
+    @mark.parametrize("sparse_b", [False, True])
+    def test_matches_trace_of_product(self, sparse_a, sparse_b):
+        a = qu.rand_herm(4, sparse=sparse_a, density=0.7)
+        b = qu.rand_herm(4, sparse=sparse_b, density=0.7)
+        ab = a @ b
+        expected = qu.trace(ab.toarray() if qu.issparse(ab) else ab)
+        assert_almost_equal(qu.tracemm(a, b), expected)
+
+
 class TestITrace:
     @mark.parametrize("axes", [(0, 1), ((0,), (1,))])
     def test_axes_types(self, axes):
@@ -787,6 +798,13 @@ class TestChop:
         assert (a != ao).nnz == 0
         assert (b != bo).nnz == 0
 
+    def test_chop_sparse_no_entries(self):
+        a = qu.qu([0.0, 0.0], sparse=True)
+        b = qu.chop(a, inplace=False)
+        assert b.nnz == 0
+        qu.chop(a, inplace=True)
+        assert a.nnz == 0
+
 
 class TestExpec:
     @mark.parametrize("qtype1", ["ket", "dop"])
@@ -124,6 +124,14 @@ class TestRandMatrix:
         else:
             assert_allclose(a, b)
 
+    def test_rand_matrix_batched(self, dtype):
+        a = qu.rand_matrix(3, dtype=dtype, num=4)
+        assert a.shape == (4, 3, 3)
+        assert type(a) == qu.qarray
+        assert a.dtype == dtype
+        with pytest.raises(ValueError):
+            qu.rand_matrix(3, sparse=True, dtype=dtype, num=4)
+
 
 @pytest.mark.parametrize("dtype", dtypes)
 class TestRandHerm:
@@ -177,6 +185,13 @@ class TestRandRho:
         assert rho.dtype == dtype
         assert_allclose(qu.tr(rho), 1.0)
 
+    def test_rand_rho_batched(self, dtype):
+        rhos = qu.rand_rho(3, dtype=dtype, num=4)
+        assert rhos.shape == (4, 3, 3)
+        for rho in rhos:
+            assert qu.ispos(rho)
+            assert_allclose(qu.tr(rho), 1.0, rtol=1e-5)
+
     def test_rand_rho_sparse(self, dtype):
         rho = qu.rand_rho(3, sparse=True, density=0.3, dtype=dtype)
         assert rho.shape == (3, 3)